@@ -7,8 +7,11 @@ Fully compatible with ARC4 contracts.
 import argparse
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import requests
 from algokit_utils import (
     Account,
     ApplicationClient,
@@ -16,28 +19,231 @@ from algokit_utils import (
     get_account,
     get_algod_client,
 )
-from algosdk import transaction
+from algosdk import constants, error, transaction
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
 from algosdk.logic import get_application_address
-from algosdk.atomic_transaction_composer import AccountTransactionSigner
-from algosdk.v2client.algod import AlgodClient
+from algosdk.transaction import OnComplete
+from algosdk.v2client.algod import (
+    AlgodClient,
+    AlgodResponseType,
+    ParamsType,
+    api_version_path_prefix,
+)
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ABI method defined manually; parsed once at import, not per call
+_CREATE_ELECTION_METHOD = Method.from_signature("create_election(uint64,uint64)string")
+
+# Consecutive transient failures (5xx, long-poll timeouts) the algod polling
+# loops retry before re-raising the last one; see PollFailures
+MAX_POLL_FAILURES = 5
+
+# algod holds wait-for-block-after open for up to a minute before answering,
+# so the long-poll needs a longer client timeout than the SDK's 30s default
+LONG_POLL_TIMEOUT = 90
 
 
 # ============================================================
 # NETWORK CLIENT
 # ============================================================
 
+
+class PooledAlgodClient(AlgodClient):
+    """
+    AlgodClient that sends every request through one keep-alive Session.
+
+    The SDK opens a new urllib connection (TCP + TLS handshake) per call;
+    a deploy makes ~10 sequential calls, so reusing the socket saves a
+    full round trip on each of them.
+    """
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(algod_token, algod_address, headers)
+
+        # Read timeouts are not retried here: they surface as
+        # requests.exceptions.ReadTimeout so long-poll callers can decide
+        retry = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.2,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+
+        self.session = Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: ParamsType | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> AlgodResponseType:
+        # Same signature and error/empty-body handling as AlgodClient.algod_request;
+        # only the transport differs
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+
+        resp = self.session.request(
+            method,
+            self.algod_address + requrl,
+            params=params,
+            data=data,
+            headers=header,
+            timeout=timeout,
+        )
+
+        if not resp.ok:
+            try:
+                body = resp.json()
+                message, err_data = body["message"], body.get("data")
+            except (ValueError, KeyError, TypeError, AttributeError):
+                message, err_data = resp.text, None
+            raise error.AlgodHTTPError(message, resp.status_code, err_data)
+
+        if response_format == "json":
+            # Some algod endpoints answer 200 OK with an empty body
+            if resp.status_code == 200 and not resp.content:
+                return {}
+            try:
+                return resp.json()
+            except ValueError as e:
+                raise error.AlgodResponseError(
+                    f"Failed to parse JSON response from algod: {e}"
+                ) from e
+
+        return resp.content
+
+
 def get_testnet_client() -> AlgodClient:
-    return AlgodClient(
+    return PooledAlgodClient(
         algod_token="",
         algod_address="https://testnet-api.algonode.cloud",
         headers={"User-Agent": "VeriVote"},
     )
 
 
+# ============================================================
+# CONFIRMATION
+# ============================================================
+
+
+class PollFailures:
+    """
+    Consecutive-failure budget for the algod polling loops.
+
+    Each transient failure (5xx, long-poll timeout, ...) is counted with
+    allow_retry(); past MAX_POLL_FAILURES in a row it returns False and the
+    caller re-raises. 5xx answers back off exponentially between retries,
+    a timed-out long-poll is re-issued straight away.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.delay = 0.25
+
+    def reset(self) -> None:
+        self.count = 0
+        self.delay = 0.25
+
+    def allow_retry(self, *, backoff: bool) -> bool:
+        self.count += 1
+        if self.count > MAX_POLL_FAILURES:
+            return False
+        if backoff:
+            time.sleep(self.delay)
+            self.delay = min(self.delay * 2, 4.0)
+        return True
+
+
+def _wait_for_tx(
+    algod_client: AlgodClient, tx_id: str, timeout_rounds: int = 4
+) -> dict[str, Any]:
+    """
+    Wait for tx_id to be confirmed using algod's block long-poll.
+
+    /v2/status/wait-for-block-after/{round} is held open server-side and
+    answers as soon as the next block is committed, so each check lands right
+    on a block boundary with no client-side sleep in between. 5xx answers are
+    retried with exponential backoff, a long-poll that times out is
+    re-issued, and a 404 for the tx (not seen by this node yet) waits for the
+    next block. All three count as failures: after MAX_POLL_FAILURES in a row
+    the last error is raised. Other 4xx answers, and timeouts on any other
+    call, are raised straight away.
+    """
+    last_round = algod_client.status()["last-round"]
+    current_round = last_round
+    failures = PollFailures()
+
+    while current_round <= last_round + timeout_rounds:
+        try:
+            try:
+                tx_info = algod_client.pending_transaction_info(tx_id)
+            except error.AlgodHTTPError as e:
+                if e.code != 404:
+                    raise
+                # Behind a load balancer the node asked may not have seen a
+                # tx another node accepted: wait for a block and ask again
+                tx_info = None
+                if not failures.allow_retry(backoff=False):
+                    raise
+            if tx_info is not None:
+                if tx_info.get("confirmed-round", 0) > 0:
+                    return tx_info
+                if tx_info.get("pool-error"):
+                    raise error.TransactionRejectedError(tx_info["pool-error"])
+
+            try:
+                status = algod_client.status_after_block(
+                    current_round, timeout=LONG_POLL_TIMEOUT
+                )
+            except (TimeoutError, requests.exceptions.ReadTimeout):
+                # No answer within LONG_POLL_TIMEOUT: check the tx and poll again
+                if not failures.allow_retry(backoff=False):
+                    raise
+                continue
+            current_round = status["last-round"]
+            if tx_info is not None:
+                failures.reset()
+        except error.AlgodHTTPError as e:
+            if e.code is None or e.code < 500 or not failures.allow_retry(backoff=True):
+                raise
+
+    raise error.ConfirmationTimeoutError(
+        f"Transaction {tx_id} not confirmed after {timeout_rounds} rounds"
+    )
+
+
 # ============================================================
 # LOAD SPEC
 # ============================================================
 
+
 def load_app_spec() -> ApplicationSpecification:
     spec_path = (
         Path(__file__).parent.parent
@@ -50,6 +256,7 @@ def load_app_spec() -> ApplicationSpecification:
         print(f"❌ App spec not found at {spec_path}")
         sys.exit(1)
 
+    # One deploy loads the spec once, so parsing it directly is all this needs
     with open(spec_path) as f:
         spec_json = f.read()
 
@@ -60,7 +267,14 @@ def load_app_spec() -> ApplicationSpecification:
 # DEPLOY
 # ============================================================
 
-def deploy_contract(algod_client, creator_account, app_spec):
+
+def deploy_contract(
+    algod_client: AlgodClient,
+    creator_account: Account,
+    signer: AccountTransactionSigner,
+    app_spec: ApplicationSpecification,
+    sp: transaction.SuggestedParams,
+) -> int:
 
     print("\n🚀 Deploying VotingContract to Algorand TestNet...")
     print(f"   Creator: {creator_account.address}")
@@ -68,14 +282,17 @@ def deploy_contract(algod_client, creator_account, app_spec):
     app_client = ApplicationClient(
         algod_client=algod_client,
         app_spec=app_spec,
-        signer=AccountTransactionSigner(creator_account.private_key),
+        signer=signer,
         sender=creator_account.address,
     )
 
-    result = app_client.create()
+    # create() would block on its own confirmation wait and then look the
+    # app id up again; compose and submit so _wait_for_tx is the only wait
+    atc = AtomicTransactionComposer()
+    app_client.compose_create(atc, transaction_parameters={"suggested_params": sp})
 
-    tx_id = result.tx_id
-    confirmed_txn = transaction.wait_for_confirmation(algod_client, tx_id, 4)
+    tx_id = atc.submit(algod_client)[0]
+    confirmed_txn = _wait_for_tx(algod_client, tx_id, 4)
 
     app_id = confirmed_txn["application-index"]
     app_address = get_application_address(app_id)
@@ -89,41 +306,26 @@ def deploy_contract(algod_client, creator_account, app_spec):
 
 
 # ============================================================
-# FUND CONTRACT
+# FUND + INITIALIZE ELECTION (6-HOUR WINDOW FOR DEMO)
 # ============================================================
 
-def fund_contract(algod_client, creator_account, app_address):
-
-    print("\n💰 Funding contract with 0.1 ALGO...")
-
-    params = algod_client.suggested_params()
-
-    txn = transaction.PaymentTxn(
-        sender=creator_account.address,
-        sp=params,
-        receiver=app_address,
-        amt=100_000,
-    )
-
-    signed_txn = txn.sign(creator_account.private_key)
-    tx_id = algod_client.send_transaction(signed_txn)
-
-    transaction.wait_for_confirmation(algod_client, tx_id, 4)
-
-    print("   ✅ Funded contract")
-
 
-# ============================================================
-# INITIALIZE ELECTION (6-HOUR WINDOW FOR DEMO)
-# ============================================================
-
-def initialize_election(algod_client, creator_account, app_spec, app_id):
+def fund_and_initialize_election(
+    algod_client: AlgodClient,
+    creator_account: Account,
+    signer: AccountTransactionSigner,
+    app_id: int,
+    sp: transaction.SuggestedParams,
+) -> None:
+    """
+    Fund the app and call create_election in one atomic group.
 
-    print("\n🗳️ Initializing election...")
+    The app ID (and so the app address) only exists once the create
+    transaction is confirmed, so creation stays separate; the payment and
+    the ABI call after it share a single confirmation wait.
+    """
 
-    from algosdk.atomic_transaction_composer import AtomicTransactionComposer
-    from algosdk.abi import Method
-    from algosdk.transaction import OnComplete
+    print("\n💰 Funding contract with 0.1 ALGO and initializing election...")
 
     current_time = int(time.time())
     start_time = current_time - 60  # Started 60 seconds ago
@@ -133,39 +335,39 @@ def initialize_election(algod_client, creator_account, app_spec, app_id):
     print(f"   End time: {end_time}")
     print(f"   Duration: 6 hours ({6 * 3600} seconds)")
 
-    signer = AccountTransactionSigner(creator_account.private_key)
-
     atc = AtomicTransactionComposer()
 
-    # Define ABI method manually
-    method = Method.from_signature(
-        "create_election(uint64,uint64)string"
+    fund_txn = transaction.PaymentTxn(
+        sender=creator_account.address,
+        sp=sp,
+        receiver=get_application_address(app_id),
+        amt=100_000,
     )
-
-    params = algod_client.suggested_params()
+    atc.add_transaction(TransactionWithSigner(fund_txn, signer))
 
     atc.add_method_call(
         app_id=app_id,
-        method=method,
+        method=_CREATE_ELECTION_METHOD,
         sender=creator_account.address,
-        sp=params,
+        sp=sp,
         signer=signer,
         method_args=[start_time, end_time],
         on_complete=OnComplete.NoOpOC,
     )
 
-    result = atc.execute(algod_client, 4)
+    tx_ids = atc.submit(algod_client)
+    _wait_for_tx(algod_client, tx_ids[-1], 4)
 
+    print("   ✅ Funded contract")
     print("   ✅ Election initialized successfully")
-    print(f"   Tx ID: {result.tx_ids[0]}")
-
-
+    print(f"   Tx ID: {tx_ids[-1]}")
 
 
 # ============================================================
 # MAIN
 # ============================================================
 
+
 def main():
 
     parser = argparse.ArgumentParser()
@@ -179,24 +381,47 @@ def main():
 
     if args.network == "testnet":
         algod_client = get_testnet_client()
-        creator_account = get_account(algod_client, "DEPLOYER")
     else:
         algod_client = get_algod_client()
-        creator_account = get_account(algod_client, "DEPLOYER")
 
-    app_spec = load_app_spec()
-
-    app_id = deploy_contract(algod_client, creator_account, app_spec)
+    # Spec load is local file I/O, account and params are independent
+    # network calls, so all three can overlap.
+    # Suggested params stay valid for ~1000 rounds, far longer than a deploy.
+    setup_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        fut_spec = executor.submit(load_app_spec)
+        fut_account = executor.submit(get_account, algod_client, "DEPLOYER")
+        fut_sp = executor.submit(algod_client.suggested_params)
+
+    creator_account, app_spec, sp = (
+        fut_account.result(),
+        fut_spec.result(),
+        fut_sp.result(),
+    )
+    print(
+        f"\n📄 Loaded account, app spec and params in "
+        f"{(time.perf_counter() - setup_started) * 1000:.1f} ms"
+    )
 
-    app_address = get_application_address(app_id)
+    signer = AccountTransactionSigner(creator_account.private_key)
 
-    fund_contract(algod_client, creator_account, app_address)
+    app_id = deploy_contract(algod_client, creator_account, signer, app_spec, sp)
 
-    initialize_election(algod_client, creator_account, app_spec, app_id)
+    try:
+        fund_and_initialize_election(algod_client, creator_account, signer, app_id, sp)
+    except error.AlgodHTTPError as e:
+        if "txn dead" not in str(e):
+            raise
+        # Validity window passed (e.g. a very slow network); refresh once
+        sp = algod_client.suggested_params()
+        fund_and_initialize_election(algod_client, creator_account, signer, app_id, sp)
 
-    print(f"\n📝 Update frontend .env:")
+    print("\n📝 Update frontend .env:")
     print(f"VITE_VOTING_APP_ID={app_id}")
 
+    print("\n📡 Stream live results (one long-poll per block, no timer polling):")
+    print(f"python stream_results.py --network {args.network} --app-id {app_id}")
+
     print("\n🎉 Deployment Complete!")
     print("   Election is LIVE and runs for 6 hours.")
     print("   No time window issues during demo!")
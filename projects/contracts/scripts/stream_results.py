@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Live Results Streamer for VeriVote Smart Contract
+Prints one JSON line per change in the election tallies.
+
+Instead of re-fetching results on a timer, this holds one long-poll open
+against algod's /v2/status/wait-for-block-after/{round} endpoint and only
+reads the tallies when a new block is committed (~every 3-4.5s). State can
+only change at a block boundary, so this never misses an update and never
+asks for one that cannot exist.
+"""
+
+import argparse
+import json
+import sys
+
+import requests
+from algokit_utils import get_algod_client
+from algosdk import error, transaction
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, EmptySigner
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest
+from deploy_voting import LONG_POLL_TIMEOUT, PollFailures, get_testnet_client
+
+GET_COUNTS_METHOD = Method.from_signature(
+    "get_counts()(uint64,uint64,uint64,uint64,uint64,uint64)"
+)
+
+COUNT_FIELDS = (
+    "candidate_a_votes",
+    "candidate_b_votes",
+    "total_voters",
+    "election_start",
+    "election_end",
+    "election_closed",
+)
+
+# Refetch suggested params this many rounds before their last valid round
+SP_REFRESH_ROUNDS = 10
+
+
+# ============================================================
+# READ COUNTS (SIMULATED, NO TRANSACTION SUBMITTED)
+# ============================================================
+
+
+def read_counts(
+    algod_client: AlgodClient,
+    app_id: int,
+    reader_address: str,
+    sp: transaction.SuggestedParams,
+) -> dict[str, int]:
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=app_id,
+        method=GET_COUNTS_METHOD,
+        sender=reader_address,
+        sp=sp,
+        signer=EmptySigner(),
+    )
+
+    result = atc.simulate(
+        algod_client,
+        SimulateRequest(txn_groups=[], allow_empty_signatures=True),
+    )
+
+    # A rejected call still comes back as a simulate result, with no return value
+    if result.failure_message:
+        raise error.AlgodResponseError(
+            f"get_counts simulate failed: {result.failure_message}"
+        )
+    abi_result = result.abi_results[0]
+    if abi_result.decode_error:
+        raise error.AlgodResponseError(
+            f"Could not decode get_counts result: {abi_result.decode_error}"
+        )
+
+    return dict(zip(COUNT_FIELDS, abi_result.return_value, strict=True))
+
+
+# ============================================================
+# STREAM
+# ============================================================
+
+
+def stream_results(algod_client: AlgodClient, app_id: int) -> None:
+    # Simulate needs a funded sender for the fee check; the creator always is
+    app_info = algod_client.application_info(app_id)
+    reader_address = app_info["params"]["creator"]
+
+    current_round = algod_client.status()["last-round"]
+    last_counts = None
+
+    # Suggested params stay valid for ~1000 rounds; refetch them only when the
+    # read-only call is about to fall outside that window
+    sp = algod_client.suggested_params()
+
+    # One transient algod failure must not end a long-running stream:
+    # 5xx answers, dropped connections and long-poll timeouts are retried
+    # under the same budget _wait_for_tx uses
+    failures = PollFailures()
+
+    while True:
+        try:
+            if current_round + SP_REFRESH_ROUNDS >= sp.last:
+                sp = algod_client.suggested_params()
+
+            counts = read_counts(algod_client, app_id, reader_address, sp)
+
+            if counts != last_counts:
+                print(json.dumps({"round": current_round, **counts}), flush=True)
+                last_counts = counts
+
+            # Blocks server-side until the next block is committed
+            try:
+                status = algod_client.status_after_block(
+                    current_round, timeout=LONG_POLL_TIMEOUT
+                )
+            except (TimeoutError, requests.exceptions.ReadTimeout):
+                # No answer in time (e.g. a stalled proxy): poll again
+                if not failures.allow_retry(backoff=False):
+                    raise
+                continue
+            current_round = status["last-round"]
+            failures.reset()
+        except error.AlgodHTTPError as e:
+            # The simulate POST is not retried by the session's urllib3 Retry
+            if e.code is None or e.code < 500 or not failures.allow_retry(backoff=True):
+                raise
+        except requests.exceptions.ConnectionError:
+            if not failures.allow_retry(backoff=True):
+                raise
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--network", choices=["localnet", "testnet"], default="testnet")
+    parser.add_argument("--app-id", type=int, required=True)
+    args = parser.parse_args()
+
+    if args.network == "testnet":
+        algod_client = get_testnet_client()
+    else:
+        algod_client = get_algod_client()
+
+    print(
+        f"📡 Streaming results for app {args.app_id} (Ctrl+C to stop)", file=sys.stderr
+    )
+
+    try:
+        stream_results(algod_client, args.app_id)
+    except KeyboardInterrupt:
+        pass
+    except (
+        error.AlgodHTTPError,
+        error.AlgodResponseError,
+        requests.exceptions.RequestException,
+    ) as e:
+        print(f"❌ algod request failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
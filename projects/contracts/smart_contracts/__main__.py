@@ -1,23 +1,117 @@
+import argparse
+import hashlib
+import importlib.metadata
+import shutil
+import subprocess
+import sys
+import tempfile
 from pathlib import Path
 
-from algokit_utils import AlgorandClient
-from algosdk.v2client.algod import AlgodClient
-from algosdk.v2client.indexer import IndexerClient
-
-from smart_contracts.voting.contract import VotingContract
-
-
-def main(
-    algorand: AlgorandClient,
-    algod_client: AlgodClient,
-    indexer_client: IndexerClient,
-    artifacts_dir: Path,
-) -> None:
-    """Main function for building contracts."""
-    VotingContract(version=1).compile(
-        algod_client=algod_client,
-        project_root=artifacts_dir.parent.parent,
-        with_sourcemaps=True,
-        compilation_output_arc32_json=True,
-        compilation_output_arc56_json=True,
+CONTRACT_DIR = Path(__file__).parent / "voting"
+CONTRACT_PATH = CONTRACT_DIR / "contract.py"
+ARTIFACTS_DIR = Path(__file__).parent / "artifacts"
+ARTIFACT_GLOB = "VotingContract.*"
+# Written only by --debug builds; never committed
+DEBUG_ARTIFACT_GLOBS = ("VotingContract.*.puya.map", "VotingContract.arc56.json")
+
+
+class _Args(argparse.Namespace):
+    command: str
+    no_cache: bool
+    debug: bool
+
+
+def _puyapy_argv(*, debug: bool) -> list[str]:
+    """Command line that compiles the contract; release builds skip sourcemaps and ARC56."""
+    return [
+        sys.executable,
+        "-m",
+        "puyapy",
+        str(CONTRACT_PATH),
+        # Next to the contract so source maps point at contract.py
+        f"--out-dir={CONTRACT_DIR}",
+        "--optimization-level=2",
+        "--output-teal",
+        "--output-arc32",
+        "--output-source-map" if debug else "--no-output-source-map",
+        "--output-arc56" if debug else "--no-output-arc56",
+    ]
+
+
+def _build_hash(argv: list[str]) -> str:
+    """Hash of the contract source, compiler version and puyapy arguments that produced the artifacts."""
+    try:
+        puya_version = importlib.metadata.version("puyapy")
+    except importlib.metadata.PackageNotFoundError:
+        puya_version = "unknown"
+
+    source = CONTRACT_PATH.read_bytes()
+    # The interpreter path is left out: puya_version already pins the compiler
+    args = "\0".join(argv[1:]).encode()
+    return hashlib.sha256(source + puya_version.encode() + args).hexdigest()
+
+
+def _remove_debug_artifacts() -> None:
+    """Clear sourcemaps and ARC56 an earlier --debug build left next to the contract."""
+    for pattern in DEBUG_ARTIFACT_GLOBS:
+        for stale in CONTRACT_DIR.glob(pattern):
+            stale.unlink()
+
+
+def build(artifacts_dir: Path, *, use_cache: bool = True, debug: bool = False) -> None:
+    """Compile the voting contract with puyapy, reusing cached output when nothing changed."""
+    argv = _puyapy_argv(debug=debug)
+    cache_dir = artifacts_dir / f".puya_cache_{_build_hash(argv)}"
+
+    # Only the newest build is kept: caches for other hashes are dead weight
+    for stale_cache in artifacts_dir.glob(".puya_cache_*"):
+        if stale_cache != cache_dir:
+            shutil.rmtree(stale_cache, ignore_errors=True)
+
+    if use_cache and (cache_dir / "VotingContract.arc32.json").exists():
+        # Same source, compiler and arguments: the cached output is what puyapy would write
+        if not debug:
+            _remove_debug_artifacts()
+        for cached in cache_dir.glob(ARTIFACT_GLOB):
+            shutil.copy2(cached, CONTRACT_DIR / cached.name)
+        return
+
+    # The last good outputs are kept aside and put back if the compile fails,
+    # so a broken contract.py never leaves deploy_voting.py without a spec
+    with tempfile.TemporaryDirectory() as backup:
+        for artifact in CONTRACT_DIR.glob(ARTIFACT_GLOB):
+            shutil.copy2(artifact, Path(backup) / artifact.name)
+
+        result = subprocess.run(argv, check=False)
+        if result.returncode != 0:
+            for artifact in Path(backup).iterdir():
+                shutil.copy2(artifact, CONTRACT_DIR / artifact.name)
+            raise SystemExit(result.returncode)
+
+    if not debug:
+        _remove_debug_artifacts()
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    cache_dir.mkdir(parents=True)
+    for artifact in CONTRACT_DIR.glob(ARTIFACT_GLOB):
+        shutil.copy2(artifact, cache_dir / artifact.name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=["build", "deploy"])
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Always recompile the contract"
     )
+    parser.add_argument(
+        "--debug", action="store_true", help="Emit sourcemaps and ARC56 for local dev"
+    )
+    args = parser.parse_args(namespace=_Args())
+
+    if args.command == "build":
+        build(ARTIFACTS_DIR, use_cache=not args.no_cache, debug=args.debug)
+    else:
+        # Elections are deployed and started by scripts/deploy_voting.py
+        print(
+            "Nothing to deploy here; run scripts/deploy_voting.py --network <localnet|testnet>"
+        )
@@ -3,48 +3,53 @@ VeriVote: Blockchain Voting Smart Contract
 A production-ready voting system with time-lock enforcement and AI transparency.
 """
 
+import typing
+
 from algopy import (
     ARC4Contract,
     Global,
+    LocalState,
+    OnCompleteAction,
     Txn,
     UInt64,
-    LocalState,
     arc4,
-    OnCompleteAction,
+    op,
+    subroutine,
 )
 
+# Two 32-bit counters / timestamps share one UInt64 global slot:
+# low half = first value, high half = second value.
+UINT32_MAX = 0xFFFFFFFF
+
+# SHA-256 digest of the AI transparency report
+Sha256Hash: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+
 
 class VotingContract(ARC4Contract):
     """
     VeriVote Smart Contract - Secure Campus Election System
 
     Global State:
-    - candidate_a_votes
-    - candidate_b_votes
-    - election_start
-    - election_end
-    - total_voters
-    - ai_report_hash
+    - vote_counts (bits 0..31 = candidate A, bits 32..63 = candidate B)
+    - election_window (bits 32..63 = start, bits 0..31 = end)
+    - ai_report_hash (32 bytes, all zero until the election is closed)
     - election_closed
 
+    total_voters is derived as candidate A + candidate B votes.
+
     Local State (per voter):
-    - has_voted
-    - vote_timestamp
+    - voter_state (bit 0 = has_voted, bits 1..63 = vote_timestamp)
     """
 
     def __init__(self) -> None:
         # Global state
-        self.candidate_a_votes = UInt64(0)
-        self.candidate_b_votes = UInt64(0)
-        self.election_start = UInt64(0)
-        self.election_end = UInt64(0)
-        self.total_voters = UInt64(0)
-        self.ai_report_hash = arc4.DynamicBytes(b"")
+        self.vote_counts = UInt64(0)
+        self.election_window = UInt64(0)
+        self.ai_report_hash = Sha256Hash.from_bytes(op.bzero(32))
         self.election_closed = UInt64(0)
 
         # Local state - stored per account
-        self.has_voted = LocalState(UInt64)
-        self.vote_timestamp = LocalState(UInt64)
+        self.voter_state = LocalState(UInt64)
 
     # ============================================================
     # CREATE ELECTION
@@ -65,15 +70,13 @@ class VotingContract(ARC4Contract):
 
         assert start < end, "Start time must be before end time"
         assert end > current_time, "End time must be in the future"
+        assert end <= UINT32_MAX, "End time must fit in 32 bits"
 
-        self.candidate_a_votes = UInt64(0)
-        self.candidate_b_votes = UInt64(0)
-        self.total_voters = UInt64(0)
+        self.vote_counts = UInt64(0)
         self.election_closed = UInt64(0)
 
-        self.election_start = start
-        self.election_end = end
-        self.ai_report_hash = arc4.DynamicBytes(b"")
+        self.election_window = (start << 32) | end
+        self.ai_report_hash = Sha256Hash.from_bytes(op.bzero(32))
 
         return arc4.String("Election created successfully")
 
@@ -84,25 +87,51 @@ class VotingContract(ARC4Contract):
     @arc4.abimethod(allow_actions=[OnCompleteAction.NoOp])
     def cast_vote(self, candidate_id: arc4.UInt64) -> arc4.String:
 
+        self._record_vote(candidate_id.native)
+
+        return arc4.String("Vote recorded successfully")
+
+    # ============================================================
+    # VOTE WITH OPT-IN (SINGLE TRANSACTION)
+    # ============================================================
+
+    @arc4.abimethod(allow_actions=[OnCompleteAction.OptIn, OnCompleteAction.NoOp])
+    def vote_with_optin(self, candidate_id: arc4.UInt64) -> arc4.String:
+
+        # First vote: send as OptIn so opt-in and vote share one transaction
+        if Txn.on_completion == OnCompleteAction.OptIn:
+            self.voter_state[Txn.sender] = UInt64(0)
+
+        self._record_vote(candidate_id.native)
+
+        return arc4.String("Vote recorded successfully")
+
+    @subroutine
+    def _record_vote(self, candidate: UInt64) -> None:
+
         current_time = Global.latest_timestamp
-        candidate = candidate_id.native
 
-        assert current_time >= self.election_start, "Election has not started yet"
-        assert current_time <= self.election_end, "Election has ended"
+        assert current_time >= self._election_start(), "Election has not started yet"
+        assert current_time <= self._election_end(), "Election has ended"
         assert self.election_closed == 0, "Election is closed"
-        assert self.has_voted[Txn.sender] == 0, "You have already voted"
-        assert candidate == 1 or candidate == 2, "Invalid candidate ID (must be 1 or 2)"
+        assert (self.voter_state[Txn.sender] & 1) == 0, "You have already voted"
+        # Branchless range check (`or` compiles to bnz/bz): (c >> 1) + (c & 1)
+        # is 1 only for c == 1 or c == 2; 0 gives 0, 3 and up give 2 or more
+        in_range = (candidate >> 1) + (candidate & 1)
+        assert in_range == 1, "Invalid candidate ID (must be 1 or 2)"
 
-        if candidate == 1:
-            self.candidate_a_votes += 1
-        else:
-            self.candidate_b_votes += 1
+        # One global read serves both the limit check and the update.
+        # Branchless: shift the chosen candidate's half (0 for A, 32 for B)
+        # down and check it alone
+        counts = self.vote_counts
+        tally = (counts >> ((candidate - 1) * 32)) & UINT32_MAX
+        assert tally < UINT32_MAX, "Vote limit reached"
 
-        self.total_voters += 1
-        self.has_voted[Txn.sender] = UInt64(1)
-        self.vote_timestamp[Txn.sender] = current_time
+        # Branchless: candidate 1 adds 1 (low half), candidate 2 adds
+        # 1 + UINT32_MAX == 2**32 (high half)
+        self.vote_counts = counts + 1 + (candidate - 1) * UINT32_MAX
 
-        return arc4.String("Vote recorded successfully")
+        self.voter_state[Txn.sender] = (current_time << 1) | 1
 
     # ============================================================
     # CLOSE ELECTION
@@ -114,9 +143,11 @@ class VotingContract(ARC4Contract):
         assert Txn.sender == Global.creator_address, "Only creator can close election"
 
         current_time = Global.latest_timestamp
-        assert current_time > self.election_end, "Election has not ended yet"
+        assert current_time > self._election_end(), "Election has not ended yet"
 
-        self.ai_report_hash = ai_hash.copy()
+        assert ai_hash.length == 32, "AI hash must be exactly 32 bytes (SHA256)"
+
+        self.ai_report_hash = Sha256Hash.from_bytes(ai_hash.native)
         self.election_closed = UInt64(1)
 
         return arc4.String("Election closed successfully with AI report hash stored")
@@ -135,21 +166,61 @@ class VotingContract(ARC4Contract):
         arc4.UInt64,
         arc4.UInt64,
         arc4.UInt64,
-        arc4.DynamicBytes,
+        Sha256Hash,
     ]:
 
+        a_votes = self._candidate_a_votes()
+        b_votes = self._candidate_b_votes()
+
         return arc4.Tuple(
             (
-                arc4.UInt64(self.candidate_a_votes),
-                arc4.UInt64(self.candidate_b_votes),
-                arc4.UInt64(self.total_voters),
-                arc4.UInt64(self.election_start),
-                arc4.UInt64(self.election_end),
+                arc4.UInt64(a_votes),
+                arc4.UInt64(b_votes),
+                arc4.UInt64(a_votes + b_votes),
+                arc4.UInt64(self._election_start()),
+                arc4.UInt64(self._election_end()),
                 arc4.UInt64(self.election_closed),
                 self.ai_report_hash.copy(),
             )
         )
 
+    # ============================================================
+    # READ COUNTS / AI HASH (READ-ONLY)
+    # ============================================================
+
+    @arc4.abimethod(readonly=True)
+    def get_counts(
+        self,
+    ) -> arc4.Tuple[
+        arc4.UInt64,
+        arc4.UInt64,
+        arc4.UInt64,
+        arc4.UInt64,
+        arc4.UInt64,
+        arc4.UInt64,
+    ]:
+        # Same as get_results minus the AI hash, for clients polling tallies
+
+        a_votes = self._candidate_a_votes()
+        b_votes = self._candidate_b_votes()
+
+        return arc4.Tuple(
+            (
+                arc4.UInt64(a_votes),
+                arc4.UInt64(b_votes),
+                arc4.UInt64(a_votes + b_votes),
+                arc4.UInt64(self._election_start()),
+                arc4.UInt64(self._election_end()),
+                arc4.UInt64(self.election_closed),
+            )
+        )
+
+    @arc4.abimethod(readonly=True)
+    def get_ai_hash(self) -> Sha256Hash:
+        # Only meaningful once election_closed == 1
+
+        return self.ai_report_hash.copy()
+
     # ============================================================
     # GET VOTER STATUS (READ-ONLY)
     # ============================================================
@@ -162,10 +233,12 @@ class VotingContract(ARC4Contract):
         arc4.UInt64,
     ]:
 
+        voter_state = self.voter_state[Txn.sender]
+
         return arc4.Tuple(
             (
-                arc4.UInt64(self.has_voted[Txn.sender]),
-                arc4.UInt64(self.vote_timestamp[Txn.sender]),
+                arc4.UInt64(voter_state & 1),
+                arc4.UInt64(voter_state >> 1),
             )
         )
 
@@ -176,7 +249,26 @@ class VotingContract(ARC4Contract):
     @arc4.abimethod(allow_actions=[OnCompleteAction.OptIn])
     def opt_in_voter(self) -> arc4.String:
 
-        self.has_voted[Txn.sender] = UInt64(0)
-        self.vote_timestamp[Txn.sender] = UInt64(0)
+        self.voter_state[Txn.sender] = UInt64(0)
+
+        return arc4.String("Voter opted in successfully")
+
+    # ============================================================
+    # PACKED STATE ACCESSORS
+    # ============================================================
+
+    @subroutine
+    def _candidate_a_votes(self) -> UInt64:
+        return self.vote_counts & UINT32_MAX
+
+    @subroutine
+    def _candidate_b_votes(self) -> UInt64:
+        return self.vote_counts >> 32
+
+    @subroutine
+    def _election_start(self) -> UInt64:
+        return self.election_window >> 32
 
-        return arc4.String("Voter opted in successfully")
\ No newline at end of file
+    @subroutine
+    def _election_end(self) -> UInt64:
+        return self.election_window & UINT32_MAX
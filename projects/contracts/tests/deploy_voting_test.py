@@ -0,0 +1,63 @@
+"""
+Tests for the deploy script's confirmation wait, run against a stub algod.
+"""
+
+from typing import Any
+
+import pytest
+from algosdk import error
+from deploy_voting import MAX_POLL_FAILURES, _wait_for_tx
+
+TX_ID = "TXID"
+
+
+class _StubAlgod:
+    """Answers pending_transaction_info from a script; each long-poll advances one round."""
+
+    def __init__(self, pending: list[dict[str, Any] | Exception]) -> None:
+        self.pending = pending
+        self.round = 100
+
+    def status(self) -> dict[str, int]:
+        return {"last-round": self.round}
+
+    def pending_transaction_info(self, tx_id: str) -> dict[str, Any]:
+        answer = self.pending.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    def status_after_block(self, block_num: int, **kwargs: Any) -> dict[str, int]:
+        self.round = block_num + 1
+        return {"last-round": self.round}
+
+
+def _not_found() -> error.AlgodHTTPError:
+    return error.AlgodHTTPError("txn not found", 404)
+
+
+def test_wait_for_tx_waits_out_a_404() -> None:
+    """A node that has not seen the tx yet answers 404; that is not a failure of the tx."""
+    confirmed = {"confirmed-round": 101}
+    algod = _StubAlgod([_not_found(), confirmed])
+
+    assert _wait_for_tx(algod, TX_ID) == confirmed
+
+
+def test_wait_for_tx_gives_up_after_repeated_404s() -> None:
+    """404s count toward MAX_POLL_FAILURES, so a tx no node knows is not waited on forever."""
+    algod = _StubAlgod([_not_found() for _ in range(MAX_POLL_FAILURES + 1)])
+
+    with pytest.raises(error.AlgodHTTPError):
+        _wait_for_tx(algod, TX_ID, timeout_rounds=MAX_POLL_FAILURES + 1)
+
+
+def test_wait_for_tx_raises_other_4xx() -> None:
+    """Any other client error is raised on the first answer."""
+    algod = _StubAlgod(
+        [error.AlgodHTTPError("bad request", 400), {"confirmed-round": 101}]
+    )
+
+    with pytest.raises(error.AlgodHTTPError):
+        _wait_for_tx(algod, TX_ID)
+    assert algod.pending, "the 400 must not be retried"
@@ -8,401 +8,527 @@ Tests cover:
 - Invalid candidate ID rejection
 - Election closure with hash storage
 - Results retrieval
+
+PYTEST_DONT_REWRITE: state assertions carry their own failure messages,
+so this module skips pytest's assertion rewriting at import.
 """
 
+import functools
+import re
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager
+
 import pytest
-from algokit_utils import ApplicationClient, get_algod_client
-from algokit_utils.config import config
+from algopy import Account, OnCompleteAction, UInt64, arc4
 from algopy_testing import AlgopyTestContext, algopy_testing_context
-from algopy import UInt64
 
-from smart_contracts.voting.contract import VotingContract
+from smart_contracts.voting.contract import UINT32_MAX, VotingContract
 
+NOW = 1000
+VALID_AI_HASH: bytes = b"a" * 32
 
-@pytest.fixture
-def context() -> AlgopyTestContext:
-    """Create a fresh AlgoPy testing context for each test."""
-    return algopy_testing_context()
+# Contract assertion messages, compiled once for pytest.raises(match=...)
+_P_START_BEFORE_END = re.compile(r"Start time must be before end time")
+_P_END_IN_FUTURE = re.compile(r"End time must be in the future")
+_P_END_32BIT = re.compile(r"End time must fit in 32 bits")
+_P_CREATOR_CREATE = re.compile(r"Only creator can create election")
+_P_ALREADY_VOTED = re.compile(r"You have already voted")
+_P_NOT_STARTED = re.compile(r"Election has not started yet")
+_P_ENDED = re.compile(r"Election has ended")
+_P_INVALID_CAND = re.compile(r"Invalid candidate ID \(must be 1 or 2\)")
+_P_VOTE_LIMIT = re.compile(r"Vote limit reached")
+_P_HASH_LENGTH = re.compile(r"AI hash must be exactly 32 bytes \(SHA256\)")
+_P_NOT_ENDED = re.compile(r"Election has not ended yet")
+_P_CREATOR_CLOSE = re.compile(r"Only creator can close election")
+
+
+@functools.lru_cache(maxsize=32)
+def _u64(value: int) -> UInt64:
+    """Return a shared UInt64 for value; UInt64 is immutable, so reuse is safe."""
+    return UInt64(value)
+
+
+@functools.lru_cache(maxsize=32)
+def _arc4_u64(value: int) -> arc4.UInt64:
+    """Return a shared arc4.UInt64 ABI argument for value; it is immutable too."""
+    return arc4.UInt64(value)
+
+
+def _set_clock(context: AlgopyTestContext, timestamp: int) -> None:
+    """Set Global.latest_timestamp for the following app calls."""
+    context.ledger.patch_global_fields(latest_timestamp=_u64(timestamp))
+
+
+def _as_sender(
+    context: AlgopyTestContext, sender: Account
+) -> AbstractContextManager[None]:
+    """Send the app call made inside the block from sender instead of the creator."""
+    return context.txn.create_group(active_txn_overrides={"sender": sender})
+
+
+@pytest.fixture(scope="module")
+def context() -> Iterator[AlgopyTestContext]:
+    """Create one AlgoPy testing context shared by every test in this module."""
+    with algopy_testing_context() as ctx:
+        yield ctx
 
 
 @pytest.fixture
 def voting_contract(context: AlgopyTestContext) -> VotingContract:
-    """Create a fresh VotingContract instance for each test."""
+    """Create a fresh VotingContract (and app id) for each test."""
     return VotingContract()
 
 
-class TestElectionCreation:
-    """Tests for create_election method."""
+@pytest.fixture(scope="module", autouse=True)
+def _clock(context: AlgopyTestContext) -> None:
+    """Pin the block timestamp to NOW once for the whole module."""
+    _set_clock(context, NOW)
 
-    def test_create_election_valid(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
-    ) -> None:
-        """Test creating an election with valid parameters."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
 
-        start_time = current_time + 100
-        end_time = current_time + 1000
+@pytest.fixture(autouse=True)
+def _reset_transactions(context: AlgopyTestContext) -> Iterator[None]:
+    """Drop the transaction groups a test recorded, keeping the shared ledger.
 
-        # Set creator as sender
-        context.set_sender(context.default_creator)
+    Contract state needs no reset: each test gets a new app id, and global and
+    local state are stored per app id in the ledger.
+    """
+    yield
+    context.clear_transaction_context()
 
-        # Create election
-        result = voting_contract.create_election(
-            start_time=UInt64(start_time),
-            end_time=UInt64(end_time),
-        )
 
-        # Verify state was set correctly
-        assert voting_contract.election_start == start_time
-        assert voting_contract.election_end == end_time
-        assert voting_contract.candidate_a_votes == 0
-        assert voting_contract.candidate_b_votes == 0
-        assert voting_contract.total_voters == 0
-        assert voting_contract.election_closed == 0
-
-    def test_create_election_invalid_time_order(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
-    ) -> None:
-        """Test that election creation fails if start_time >= end_time."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
+@pytest.fixture(scope="module")
+def voter_pool(context: AlgopyTestContext) -> list[Account]:
+    """Allocate the voter accounts once for every test in this module.
 
-        start_time = current_time + 1000
-        end_time = current_time + 100  # End before start!
+    Reuse across tests is safe only because voting_contract creates a new app
+    for each test: the ledger keys local state by (app id, account, key), so a
+    pooled account starts with no voter_state in the new app.
+    """
+    return [context.any.account() for _ in range(16)]
 
-        context.set_sender(context.default_creator)
 
-        with pytest.raises(AssertionError, match="Start time must be before end time"):
-            voting_contract.create_election(
-                start_time=UInt64(start_time),
-                end_time=UInt64(end_time),
-            )
+@pytest.fixture
+def voter_factory(
+    voting_contract: VotingContract,
+    voter_pool: list[Account],
+) -> Callable[[], Account]:
+    """Hand out a different pooled voter account on each call within a test."""
+    voters = iter(voter_pool)
 
-    def test_create_election_past_end_time(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
-    ) -> None:
-        """Test that election creation fails if end_time is in the past."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
+    def next_voter() -> Account:
+        voter = next(voters)
+        assert voter not in voting_contract.voter_state, f"{voter} has voter_state"
+        return voter
 
-        start_time = current_time - 500
-        end_time = current_time - 100  # End in the past!
+    return next_voter
 
-        context.set_sender(context.default_creator)
 
-        with pytest.raises(AssertionError, match="End time must be in the future"):
-            voting_contract.create_election(
-                start_time=UInt64(start_time),
-                end_time=UInt64(end_time),
-            )
+# Keep start_time above zero: algopy_testing treats a falsy arc4 kwarg as missing
+ELECTION_OFFSETS = {
+    "pending": (100, 1000),
+    "active": (-10, 1000),
+    "ended": (-900, -100),
+}
 
-    def test_create_election_non_creator(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
-    ) -> None:
-        """Test that only creator can create election."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
 
-        start_time = current_time + 100
-        end_time = current_time + 1000
+@pytest.fixture
+def election(
+    request: pytest.FixtureRequest,
+    context: AlgopyTestContext,
+    voting_contract: VotingContract,
+) -> tuple[int, int]:
+    """Create an election in the phase given by indirect parametrization.
+
+    Returns the (start_time, end_time) of the created election.
+    """
+    start_offset, end_offset = ELECTION_OFFSETS[request.param]
+    start_time = NOW + start_offset
+    end_time = NOW + end_offset
+
+    # create_election rejects an end time in the past, so create the election
+    # at its start time and then move the clock back to NOW. The context is
+    # shared by the module, so restore the clock even if creation fails
+    _set_clock(context, start_time)
+    try:
+        voting_contract.create_election(
+            start_time=_arc4_u64(start_time),
+            end_time=_arc4_u64(end_time),
+        )
+    finally:
+        _set_clock(context, NOW)
 
-        # Set non-creator as sender
-        non_creator = context.any_account()
-        context.set_sender(non_creator)
+    return start_time, end_time
 
-        with pytest.raises(AssertionError, match="Only creator can create election"):
-            voting_contract.create_election(
-                start_time=UInt64(start_time),
-                end_time=UInt64(end_time),
-            )
 
+def _force_state(
+    vc: VotingContract, start: int, end: int, closed: int = 0, vote_counts: int = 0
+) -> None:
+    """Write the election window and tallies directly, skipping the contract checks.
+
+    For negative-path tests that only need the contract in a given phase.
+    """
+    vc.election_window = _u64((start << 32) | end)
+    vc.election_closed = _u64(closed)
+    vc.vote_counts = _u64(vote_counts)
 
-class TestVoting:
-    """Tests for cast_vote method."""
 
-    def setup_active_election(
+def _cast_votes(
+    vc: VotingContract,
+    ctx: AlgopyTestContext,
+    voters: list[Account],
+    pattern: str,
+) -> None:
+    """Opt in and vote once per character of pattern ("A" or "B"), one voter each.
+
+    voters may be longer than pattern; zip raises if there are too few.
+    """
+    for voter, choice in zip(voters[: len(pattern)], pattern, strict=True):
+        with _as_sender(ctx, voter):
+            vc.opt_in_voter()
+        with _as_sender(ctx, voter):
+            vc.cast_vote(candidate_id=_arc4_u64(1 if choice == "A" else 2))
+
+
+class TestElectionCreation:
+    """Tests for create_election method."""
+
+    def test_create_election_valid(
         self, context: AlgopyTestContext, voting_contract: VotingContract
     ) -> None:
-        """Helper to set up an active election."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
-
-        start_time = current_time - 10  # Already started
-        end_time = current_time + 1000  # Still active
+        """Test creating an election with valid parameters."""
+        start_time = NOW + 100
+        end_time = NOW + 1000
 
-        context.set_sender(context.default_creator)
+        # Create election
         voting_contract.create_election(
-            start_time=UInt64(start_time),
-            end_time=UInt64(end_time),
+            start_time=_arc4_u64(start_time),
+            end_time=_arc4_u64(end_time),
         )
 
-    def test_cast_vote_candidate_a(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
+        # Verify state was set correctly
+        results = voting_contract.get_results()
+        state = tuple(results[i].native for i in range(6))
+        assert state == (0, 0, 0, start_time, end_time, 0), f"results={state}"
+
+    @pytest.mark.parametrize(
+        ("start_offset", "end_offset", "sender", "expected_exc_match"),
+        [
+            (1000, 100, "creator", _P_START_BEFORE_END),
+            (-500, -100, "creator", _P_END_IN_FUTURE),
+            (100, 1000, "other", _P_CREATOR_CREATE),
+            (100, UINT32_MAX + 1 - NOW, "creator", _P_END_32BIT),
+        ],
+        ids=["invalid_time_order", "past_end_time", "non_creator", "end_over_32_bits"],
+    )
+    def test_create_election_rejected(
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        start_offset: int,
+        end_offset: int,
+        sender: str,
+        expected_exc_match: re.Pattern[str],
     ) -> None:
-        """Test casting a vote for Candidate A."""
-        self.setup_active_election(context, voting_contract)
-
-        voter = context.any_account()
-        context.set_sender(voter)
+        """Test that invalid windows and non-creator senders are rejected."""
+        account = (
+            context.default_sender if sender == "creator" else context.any.account()
+        )
 
-        # Opt in voter
-        voting_contract.opt_in_voter()
+        with (
+            pytest.raises(AssertionError, match=expected_exc_match),
+            _as_sender(context, account),
+        ):
+            voting_contract.create_election(
+                start_time=_arc4_u64(NOW + start_offset),
+                end_time=_arc4_u64(NOW + end_offset),
+            )
 
-        # Cast vote
-        result = voting_contract.cast_vote(candidate_id=UInt64(1))
 
-        # Verify vote was recorded
-        assert voting_contract.candidate_a_votes == 1
-        assert voting_contract.candidate_b_votes == 0
-        assert voting_contract.total_voters == 1
-        assert voting_contract.has_voted == 1
+class TestVoting:
+    """Tests for cast_vote method."""
 
-    def test_cast_vote_candidate_b(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
+    @pytest.mark.parametrize("election", ["active"], indirect=True)
+    @pytest.mark.parametrize(
+        ("candidate_id", "expected_a", "expected_b"),
+        [(1, 1, 0), (2, 0, 1)],
+        ids=["candidate_a", "candidate_b"],
+    )
+    def test_cast_vote(
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        election: tuple[int, int],
+        candidate_id: int,
+        expected_a: int,
+        expected_b: int,
+        voter_factory: Callable[[], Account],
     ) -> None:
-        """Test casting a vote for Candidate B."""
-        self.setup_active_election(context, voting_contract)
-
-        voter = context.any_account()
-        context.set_sender(voter)
+        """Test casting a vote for each candidate."""
+        voter = voter_factory()
 
         # Opt in voter
-        voting_contract.opt_in_voter()
+        with _as_sender(context, voter):
+            voting_contract.opt_in_voter()
+        with _as_sender(context, voter):
+            status = voting_contract.get_voter_status()
+        opted_in = (status[0].native, status[1].native)
+        assert opted_in == (0, 0), f"(has_voted, vote_timestamp)={opted_in}"
 
         # Cast vote
-        result = voting_contract.cast_vote(candidate_id=UInt64(2))
+        with _as_sender(context, voter):
+            voting_contract.cast_vote(candidate_id=_arc4_u64(candidate_id))
 
         # Verify vote was recorded
-        assert voting_contract.candidate_a_votes == 0
-        assert voting_contract.candidate_b_votes == 1
-        assert voting_contract.total_voters == 1
-        assert voting_contract.has_voted == 1
-
+        results = voting_contract.get_results()
+        with _as_sender(context, voter):
+            status = voting_contract.get_voter_status()
+        state = (
+            results[0].native,
+            results[1].native,
+            results[2].native,
+            status[0].native,
+            status[1].native,
+        )
+        assert state == (
+            expected_a,
+            expected_b,
+            1,
+            1,
+            NOW,
+        ), f"(a, b, total, has_voted, vote_timestamp)={state}"
+
+    @pytest.mark.parametrize("election", ["active"], indirect=True)
     def test_double_vote_rejection(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        election: tuple[int, int],
+        voter_factory: Callable[[], Account],
     ) -> None:
         """Test that a voter cannot vote twice."""
-        self.setup_active_election(context, voting_contract)
-
-        voter = context.any_account()
-        context.set_sender(voter)
+        voter = voter_factory()
 
         # Opt in voter
-        voting_contract.opt_in_voter()
+        with _as_sender(context, voter):
+            voting_contract.opt_in_voter()
 
         # First vote should succeed
-        voting_contract.cast_vote(candidate_id=UInt64(1))
+        with _as_sender(context, voter):
+            voting_contract.cast_vote(candidate_id=_arc4_u64(1))
 
         # Second vote should fail
-        with pytest.raises(AssertionError, match="You have already voted"):
-            voting_contract.cast_vote(candidate_id=UInt64(2))
-
-    def test_vote_before_start(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
-    ) -> None:
-        """Test that voting before election starts is rejected."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
-
-        start_time = current_time + 100  # Hasn't started yet
-        end_time = current_time + 1000
-
-        context.set_sender(context.default_creator)
-        voting_contract.create_election(
-            start_time=UInt64(start_time),
-            end_time=UInt64(end_time),
-        )
-
-        voter = context.any_account()
-        context.set_sender(voter)
-        voting_contract.opt_in_voter()
-
-        with pytest.raises(AssertionError, match="Election has not started yet"):
-            voting_contract.cast_vote(candidate_id=UInt64(1))
-
-    def test_vote_after_end(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
+        with (
+            pytest.raises(AssertionError, match=_P_ALREADY_VOTED),
+            _as_sender(context, voter),
+        ):
+            voting_contract.cast_vote(candidate_id=_arc4_u64(2))
+
+    @pytest.mark.parametrize(
+        ("phase", "candidate_id", "vote_counts", "expected_exc_match"),
+        [
+            ("pending", 1, 0, _P_NOT_STARTED),
+            ("ended", 1, 0, _P_ENDED),
+            ("active", 3, 0, _P_INVALID_CAND),
+            # Candidate A's 32-bit tally is full; one more would carry into B's
+            ("active", 1, UINT32_MAX, _P_VOTE_LIMIT),
+            # Candidate B's tally is full; one more would overflow the UInt64
+            ("active", 2, UINT32_MAX << 32, _P_VOTE_LIMIT),
+        ],
+        ids=[
+            "before_start",
+            "after_end",
+            "invalid_candidate_id",
+            "vote_limit_a",
+            "vote_limit_b",
+        ],
+    )
+    def test_cast_vote_rejected(
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        phase: str,
+        candidate_id: int,
+        vote_counts: int,
+        expected_exc_match: re.Pattern[str],
+        voter_factory: Callable[[], Account],
     ) -> None:
-        """Test that voting after election ends is rejected."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
-
-        start_time = current_time - 1000
-        end_time = current_time - 100  # Already ended
-
-        context.set_sender(context.default_creator)
-        voting_contract.create_election(
-            start_time=UInt64(start_time),
-            end_time=UInt64(end_time),
+        """Test that out-of-window, unknown-candidate and over-limit votes fail."""
+        start_offset, end_offset = ELECTION_OFFSETS[phase]
+        _force_state(
+            voting_contract,
+            NOW + start_offset,
+            NOW + end_offset,
+            vote_counts=vote_counts,
         )
 
-        voter = context.any_account()
-        context.set_sender(voter)
-        voting_contract.opt_in_voter()
-
-        with pytest.raises(AssertionError, match="Election has ended"):
-            voting_contract.cast_vote(candidate_id=UInt64(1))
+        voter = voter_factory()
+        with _as_sender(context, voter):
+            voting_contract.opt_in_voter()
 
-    def test_invalid_candidate_id(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
+        with (
+            pytest.raises(AssertionError, match=expected_exc_match),
+            _as_sender(context, voter),
+        ):
+            voting_contract.cast_vote(candidate_id=_arc4_u64(candidate_id))
+
+    @pytest.mark.parametrize("election", ["active"], indirect=True)
+    def test_vote_with_optin(
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        election: tuple[int, int],
+        voter_factory: Callable[[], Account],
     ) -> None:
-        """Test that invalid candidate IDs are rejected."""
-        self.setup_active_election(context, voting_contract)
+        """Test opting in and voting in a single OptIn call."""
+        voter = voter_factory()
+
+        with context.txn.create_group(
+            active_txn_overrides={
+                "sender": voter,
+                "on_completion": OnCompleteAction.OptIn,
+            }
+        ):
+            voting_contract.vote_with_optin(candidate_id=_arc4_u64(2))
 
-        voter = context.any_account()
-        context.set_sender(voter)
-        voting_contract.opt_in_voter()
+        results = voting_contract.get_results()
+        state = tuple(results[i].native for i in range(3))
+        assert state == (0, 1, 1), f"(a, b, total)={state}"
 
-        with pytest.raises(
-            AssertionError, match="Invalid candidate ID \\(must be 1 or 2\\)"
+        # A follow-up NoOp call must still be rejected as a double vote
+        with (
+            pytest.raises(AssertionError, match=_P_ALREADY_VOTED),
+            _as_sender(context, voter),
         ):
-            voting_contract.cast_vote(candidate_id=UInt64(3))
+            voting_contract.vote_with_optin(candidate_id=_arc4_u64(1))
 
 
 class TestElectionClosure:
     """Tests for close_election method."""
 
-    def setup_ended_election(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
-    ) -> None:
-        """Helper to set up an ended election."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
-
-        start_time = current_time - 1000
-        end_time = current_time - 100  # Election has ended
-
-        context.set_sender(context.default_creator)
-        voting_contract.create_election(
-            start_time=UInt64(start_time),
-            end_time=UInt64(end_time),
-        )
-
+    @pytest.mark.parametrize("election", ["ended"], indirect=True)
     def test_close_election_valid(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        election: tuple[int, int],
     ) -> None:
         """Test closing election with valid hash."""
-        self.setup_ended_election(context, voting_contract)
+        ai_hash = VALID_AI_HASH
 
-        # Create a 32-byte hash (SHA256)
-        ai_hash = b"a" * 32
-
-        context.set_sender(context.default_creator)
-        result = voting_contract.close_election(ai_hash=ai_hash)
+        voting_contract.close_election(ai_hash=arc4.DynamicBytes(ai_hash))
 
         # Verify election was closed
-        assert voting_contract.election_closed == 1
-        assert len(voting_contract.ai_report_hash.native) == 32
+        state = (voting_contract.election_closed, voting_contract.ai_report_hash.bytes)
+        assert state == (1, ai_hash), f"(closed, hash)={state}"
 
+    @pytest.mark.parametrize("election", ["ended"], indirect=True)
     def test_close_election_invalid_hash_length(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        election: tuple[int, int],
     ) -> None:
         """Test that closing with invalid hash length fails."""
-        self.setup_ended_election(context, voting_contract)
-
         # Hash too short
         ai_hash = b"short"
 
-        context.set_sender(context.default_creator)
-
-        with pytest.raises(
-            AssertionError, match="AI hash must be exactly 32 bytes \\(SHA256\\)"
-        ):
-            voting_contract.close_election(ai_hash=ai_hash)
+        with pytest.raises(AssertionError, match=_P_HASH_LENGTH):
+            voting_contract.close_election(ai_hash=arc4.DynamicBytes(ai_hash))
 
     def test_close_election_before_end(
         self, context: AlgopyTestContext, voting_contract: VotingContract
     ) -> None:
         """Test that election cannot be closed before it ends."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
-
-        start_time = current_time - 100
-        end_time = current_time + 1000  # Still active
-
-        context.set_sender(context.default_creator)
-        voting_contract.create_election(
-            start_time=UInt64(start_time),
-            end_time=UInt64(end_time),
-        )
+        _force_state(voting_contract, NOW - 10, NOW + 1000)
 
-        ai_hash = b"a" * 32
+        ai_hash = VALID_AI_HASH
 
-        with pytest.raises(AssertionError, match="Election has not ended yet"):
-            voting_contract.close_election(ai_hash=ai_hash)
+        with pytest.raises(AssertionError, match=_P_NOT_ENDED):
+            voting_contract.close_election(ai_hash=arc4.DynamicBytes(ai_hash))
 
     def test_close_election_non_creator(
         self, context: AlgopyTestContext, voting_contract: VotingContract
     ) -> None:
         """Test that only creator can close election."""
-        self.setup_ended_election(context, voting_contract)
-
-        ai_hash = b"a" * 32
+        # The creator check runs before any window check, so no election is needed
+        ai_hash = VALID_AI_HASH
 
-        # Set non-creator as sender
-        non_creator = context.any_account()
-        context.set_sender(non_creator)
+        non_creator = context.any.account()
 
-        with pytest.raises(AssertionError, match="Only creator can close election"):
-            voting_contract.close_election(ai_hash=ai_hash)
+        with (
+            pytest.raises(AssertionError, match=_P_CREATOR_CLOSE),
+            _as_sender(context, non_creator),
+        ):
+            voting_contract.close_election(ai_hash=arc4.DynamicBytes(ai_hash))
 
 
 class TestResultsRetrieval:
     """Tests for get_results method."""
 
+    @pytest.mark.parametrize("election", ["pending"], indirect=True)
     def test_get_results_empty_election(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        election: tuple[int, int],
     ) -> None:
         """Test getting results from an election with no votes."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
-
-        start_time = current_time + 100
-        end_time = current_time + 1000
-
-        context.set_sender(context.default_creator)
-        voting_contract.create_election(
-            start_time=UInt64(start_time),
-            end_time=UInt64(end_time),
-        )
+        start_time, end_time = election
 
         results = voting_contract.get_results()
 
-        assert results[0] == 0  # candidate_a_votes
-        assert results[1] == 0  # candidate_b_votes
-        assert results[2] == 0  # total_voters
-        assert results[3] == start_time  # election_start
-        assert results[4] == end_time  # election_end
-        assert results[5] == 0  # election_closed
+        state = tuple(results[i].native for i in range(6))
+        assert state == (0, 0, 0, start_time, end_time, 0), f"results={state}"
 
+    @pytest.mark.parametrize("election", ["active"], indirect=True)
     def test_get_results_with_votes(
-        self, context: AlgopyTestContext, voting_contract: VotingContract
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        election: tuple[int, int],
+        voter_pool: list[Account],
     ) -> None:
         """Test getting results from an election with votes."""
-        current_time = 1000
-        context.set_latest_timestamp(current_time)
+        _cast_votes(voting_contract, context, voter_pool, "AAB")
 
-        start_time = current_time - 10
-        end_time = current_time + 1000
+        # Get results as any user
+        results = voting_contract.get_results()
 
-        context.set_sender(context.default_creator)
-        voting_contract.create_election(
-            start_time=UInt64(start_time),
-            end_time=UInt64(end_time),
-        )
+        state = tuple(results[i].native for i in range(3))
+        assert state == (2, 1, 3), f"(a, b, total)={state}"
+
+    @pytest.mark.parametrize("election", ["active"], indirect=True)
+    def test_get_counts_with_votes(
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        election: tuple[int, int],
+        voter_factory: Callable[[], Account],
+    ) -> None:
+        """Test that get_counts matches get_results without the AI hash."""
+        start_time, end_time = election
 
-        # Cast some votes
-        for i in range(3):
-            voter = context.any_account()
-            context.set_sender(voter)
+        voter = voter_factory()
+        with _as_sender(context, voter):
             voting_contract.opt_in_voter()
-            candidate = 1 if i < 2 else 2
-            voting_contract.cast_vote(candidate_id=UInt64(candidate))
+        with _as_sender(context, voter):
+            voting_contract.cast_vote(candidate_id=_arc4_u64(2))
 
-        # Get results as any user
-        results = voting_contract.get_results()
+        counts = voting_contract.get_counts()
+
+        state = tuple(counts[i].native for i in range(6))
+        assert state == (0, 1, 1, start_time, end_time, 0), f"counts={state}"
+
+    @pytest.mark.parametrize("election", ["ended"], indirect=True)
+    def test_get_ai_hash_after_close(
+        self,
+        context: AlgopyTestContext,
+        voting_contract: VotingContract,
+        election: tuple[int, int],
+    ) -> None:
+        """Test that get_ai_hash returns the hash stored by close_election."""
+        ai_hash = VALID_AI_HASH
+        voting_contract.close_election(ai_hash=arc4.DynamicBytes(ai_hash))
 
-        assert results[0] == 2  # candidate_a_votes
-        assert results[1] == 1  # candidate_b_votes
-        assert results[2] == 3  # total_voters
+        stored = voting_contract.get_ai_hash().bytes
+        assert stored == ai_hash, f"get_ai_hash={stored!r}, expected {ai_hash!r}"
@@ -26,7 +26,7 @@ interface ElectionState {
 const METHOD_SELECTORS: Record<string, Uint8Array> = {
     cast_vote: new Uint8Array([0x3d, 0x6c, 0x8f, 0xf7]),
     opt_in_voter: new Uint8Array([0xdd, 0x5c, 0xa5, 0x3b]),
-    get_results: new Uint8Array([0xb9, 0x29, 0xca, 0x8d]),
+    get_results: new Uint8Array([0x94, 0x90, 0x1f, 0x7f]),
     get_voter_status: new Uint8Array([0x2e, 0x93, 0x79, 0xde]),
 }
 
@@ -156,12 +156,29 @@ const VotingInterface = () => {
                     // uint64
                     const num = value.uint
                     switch (key) {
-                        case 'candidate_a_votes': state.candidateAVotes = num; break
-                        case 'candidate_b_votes': state.candidateBVotes = num; break
-                        case 'total_voters': state.totalVoters = num; break
-                        case 'election_start': state.electionStart = num; break
-                        case 'election_end': state.electionEnd = num; break
-                        case 'election_closed': state.electionClosed = num; break
+                        case 'vote_counts': {
+                            // Packed: bits 0..31 = candidate A, bits 32..63 = candidate B
+                            const packed = BigInt(num)
+                            state.candidateAVotes = Number(packed & 0xFFFFFFFFn)
+                            state.candidateBVotes = Number(packed >> 32n)
+                            state.totalVoters = state.candidateAVotes + state.candidateBVotes
+                            break
+                        }
+                        case 'election_window': {
+                            // Packed: bits 32..63 = start, bits 0..31 = end
+                            const packed = BigInt(num)
+                            state.electionStart = Number(packed >> 32n)
+                            state.electionEnd = Number(packed & 0xFFFFFFFFn)
+                            break
+                        }
+                        // Apps deployed before the packed layout (e.g. the default APP_ID)
+                        // still expose one key per counter
+                        case 'candidate_a_votes': state.candidateAVotes = Number(num); break
+                        case 'candidate_b_votes': state.candidateBVotes = Number(num); break
+                        case 'total_voters': state.totalVoters = Number(num); break
+                        case 'election_start': state.electionStart = Number(num); break
+                        case 'election_end': state.electionEnd = Number(num); break
+                        case 'election_closed': state.electionClosed = Number(num); break
                         case 'has_voted':
                             // Global has_voted - this is a contract quirk
                             // We'll handle per-user detection separately